@@ -1,8 +1,37 @@
+import asyncio
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, ConfigDict
-from typing import Self
+from typing import Any, Self
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml(file_path: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns and size are only part of the cache key, so edited files get
+    # re-parsed. A same-size rewrite landing on the same mtime tick still
+    # returns the previous parse.
+    with open(file_path, "r") as stream:
+        return yaml.safe_load(stream)
+
+
+def load_yaml(file_path: str | Path) -> Any:
+    """
+    Load a YAML file, parsing it only once per process for a given file version.
+
+    Args:
+        file_path (str | Path): The path to the YAML file.
+
+    Returns:
+        Any: A private copy of the parsed YAML data, safe to mutate.
+    """
+    resolved_path = os.path.realpath(file_path)
+    stat = os.stat(resolved_path)
+    data = _parse_yaml(resolved_path, stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(data)
 
 
 class QuivrBaseConfig(BaseModel):
@@ -19,6 +48,7 @@ class QuivrBaseConfig(BaseModel):
 
     Class Methods:
         from_yaml: Create an instance of the class from a YAML file.
+        afrom_yaml: Async version of from_yaml, run in a worker thread.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -35,8 +65,23 @@ class QuivrBaseConfig(BaseModel):
             QuivrBaseConfig: An instance of the class initialized with the data from the YAML file.
         """
         # Load the YAML file
-        with open(file_path, "r") as stream:
-            config_data = yaml.safe_load(stream)
+        config_data = load_yaml(file_path)
 
         # Instantiate the class using the YAML data
         return cls(**config_data)
+
+    @classmethod
+    async def afrom_yaml(cls, file_path: str | Path) -> Self:
+        """
+        Asynchronously create an instance of the class from a YAML file.
+
+        Reading, parsing and validating the configuration is blocking work, so it
+        runs in a worker thread to keep the event loop responsive.
+
+        Args:
+            file_path (str | Path): The path to the YAML file.
+
+        Returns:
+            QuivrBaseConfig: An instance of the class initialized with the data from the YAML file.
+        """
+        return await asyncio.to_thread(cls.from_yaml, file_path)
@@ -228,7 +228,9 @@ class Brain:
         if isinstance(self.vector_db, FAISS):
             vectordb_path = os.path.join(brain_path, "vector_store")
             os.makedirs(vectordb_path, exist_ok=True)
-            self.vector_db.save_local(folder_path=vectordb_path)
+            await asyncio.to_thread(
+                self.vector_db.save_local, folder_path=vectordb_path
+            )
             vector_store = FAISSConfig(vectordb_folder_path=vectordb_path)
         else:
             raise Exception("can't serialize other vector stores for now")
@@ -267,8 +269,9 @@ class Brain:
             storage_config=storage_config,
         )
 
-        with open(os.path.join(brain_path, "config.json"), "w") as f:
-            f.write(bserialized.model_dump_json())
+        await asyncio.to_thread(
+            Path(brain_path, "config.json").write_text, bserialized.model_dump_json()
+        )
         return brain_path
 
     def info(self) -> BrainInfo:
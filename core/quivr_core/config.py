@@ -1,8 +1,9 @@
 from enum import Enum
 
-import yaml
 from pydantic import BaseModel
 
+from quivr_core.base_config import load_yaml
+
 
 class ParserType(str, Enum):
     """Parser type enumeration."""
@@ -24,8 +25,7 @@ class MegaparseBaseConfig(BaseModel):
     @classmethod
     def from_yaml(cls, file_path: str):
         # Load the YAML file
-        with open(file_path, "r") as stream:
-            config_data = yaml.safe_load(stream)
+        config_data = load_yaml(file_path)
 
         # Instantiate the class using the YAML data
         return cls(**config_data)
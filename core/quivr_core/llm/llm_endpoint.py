@@ -7,11 +7,12 @@ from urllib.parse import parse_qs, urlparse
 import tiktoken
 from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.runnables import Runnable
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_groq import ChatGroq
 from langchain_mistralai import ChatMistralAI
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr
 
 from quivr_core.brain.info import LLMInfo
 from quivr_core.rag.entities.config import DefaultModelSuppliers, LLMEndpointConfig
@@ -199,6 +200,7 @@ class LLMEndpoint:
         self.llm_tokenizer = LLMTokenizer.load(
             llm_config.tokenizer_hub, llm_config.fallback_tokenizer
         )
+        self._structured_llms: dict[tuple[type[BaseModel], bool], Runnable] = {}
 
     def count_tokens(self, text: str) -> int:
         # Tokenize the input text and return the token count
@@ -208,6 +210,30 @@ class LLMEndpoint:
     def get_config(self):
         return self._config
 
+    def get_structured_llm(
+        self, output_class: type[BaseModel], json_schema: bool = True
+    ) -> Runnable:
+        """Get a runnable returning `output_class` instances, memoized per class.
+
+        Building one generates the JSON schema of `output_class`. Endpoints are
+        shared through `from_config`, so the cache outlives a single question.
+
+        Args:
+            output_class: The pydantic model the LLM output is parsed into.
+            json_schema: Use the `json_schema` method, otherwise the provider default.
+        """
+        key = (output_class, json_schema)
+        if key not in self._structured_llms:
+            if json_schema:
+                self._structured_llms[key] = self._llm.with_structured_output(
+                    output_class, method="json_schema"
+                )
+            else:
+                self._structured_llms[key] = self._llm.with_structured_output(
+                    output_class
+                )
+        return self._structured_llms[key]
+
     @classmethod
     def from_config(cls, config: LLMEndpointConfig = LLMEndpointConfig()):
         hashed_config = hash(config)
@@ -240,7 +266,10 @@ class LLMEndpoint:
                     temperature=config.temperature,
                 )
             elif config.supplier == DefaultModelSuppliers.ANTHROPIC:
-                assert config.llm_api_key, "Can't load model config"
+                if not config.llm_api_key:
+                    raise ValueError(
+                        f"Can't load model config: no API key set for {config.supplier}"
+                    )
                 _llm = ChatAnthropic(
                     model_name=config.model,
                     api_key=SecretStr(config.llm_api_key),
@@ -12,7 +12,8 @@ from quivr_core.processor.splitter import SplitterConfig
 def recursive_character_splitter(
     doc: Document, chunk_size: int, chunk_overlap: int
 ) -> list[Document]:
-    assert chunk_overlap < chunk_size, "chunk_overlap is greater than chunk_size"
+    if chunk_overlap >= chunk_size:
+        raise ValueError("chunk_overlap is greater than chunk_size")
 
     if len(doc.page_content) <= chunk_size:
         return [doc]
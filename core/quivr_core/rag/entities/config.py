@@ -2,13 +2,14 @@ import logging
 import os
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, Hashable, List, Optional, Type, Union
 from uuid import UUID
 
 from langchain_core.prompts.base import BasePromptTemplate
 from langchain_core.tools import BaseTool
 from langgraph.graph import END, START
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from rapidfuzz import fuzz, process
 
 from quivr_core.base_config import QuivrBaseConfig
@@ -268,6 +269,7 @@ class LLMModelConfig:
     }
 
     @classmethod
+    @lru_cache(maxsize=256)
     def get_supplier_by_model_name(cls, model: str) -> DefaultModelSuppliers | None:
         # Iterate over the suppliers and their models
         for supplier, models in cls._model_defaults.items():
@@ -279,10 +281,15 @@ class LLMModelConfig:
         return None
 
     @classmethod
+    @lru_cache(maxsize=256)
     def get_llm_model_config(
         cls, supplier: DefaultModelSuppliers, model_name: str
     ) -> Optional[LLMConfig]:
-        """Retrieve the LLMConfig (context and tokenizer_hub) for a given supplier and model."""
+        """Retrieve the LLMConfig (context and tokenizer_hub) for a given supplier and model.
+
+        Lookups are memoized per process: every LLMEndpointConfig resolves its
+        defaults through here, and `_model_defaults` is static.
+        """
         supplier_defaults = cls._model_defaults.get(supplier)
         if not supplier_defaults:
             return None
@@ -544,11 +551,15 @@ class WorkflowConfig(QuivrBaseConfig):
     available_tools: List[str] | None = None
     validated_tools: List[BaseTool | Type] = []
     activated_tools: List[BaseTool | Type] = []
+    _nodes_by_name: Dict[str, NodeConfig] = PrivateAttr(default_factory=dict)
 
     def __init__(self, **data):
         super().__init__(**data)
         self.check_first_node_is_start()
         self.validate_available_tools()
+        # Node lookups happen per streamed event, index the nodes once here
+        for node in self.nodes:
+            self._nodes_by_name.setdefault(node.name, node)
 
     def check_first_node_is_start(self):
         if self.nodes and self.nodes[0].name != START:
@@ -556,11 +567,18 @@ class WorkflowConfig(QuivrBaseConfig):
 
     def get_node_tools(self, node_name: str) -> List[Any]:
         """Get tools for a specific node."""
-        for node in self.nodes:
-            if node.name == node_name and node.instantiated_tools:
-                return node.instantiated_tools
+        node = self._nodes_by_name.get(node_name)
+        if node and node.instantiated_tools:
+            return node.instantiated_tools
         return []
 
+    def get_node_display_name(self, node_name: str) -> str:
+        """Get the description of a node, falling back to its name."""
+        node = self._nodes_by_name.get(node_name)
+        if node is None:
+            return ""
+        return node.description or node.name
+
     def validate_available_tools(self):
         if self.available_tools:
             valid_tools = list(TOOLS_CATEGORIES.keys()) + list(TOOLS_LISTS.keys())
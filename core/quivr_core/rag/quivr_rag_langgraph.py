@@ -328,19 +328,7 @@ class QuivrQARAGLangGraph:
             user_input=state["messages"][0].content,
         )
 
-        response: SplittedInput
-
-        try:
-            structured_llm = self.llm_endpoint._llm.with_structured_output(
-                SplittedInput, method="json_schema"
-            )
-            response = structured_llm.invoke(msg)
-
-        except openai.BadRequestError:
-            structured_llm = self.llm_endpoint._llm.with_structured_output(
-                SplittedInput
-            )
-            response = structured_llm.invoke(msg)
+        response: SplittedInput = self.invoke_structured_output(msg, SplittedInput)
 
         send_list: List[Send] = []
 
@@ -816,9 +804,10 @@ class QuivrQARAGLangGraph:
 
         _docs = []
 
-        assert hasattr(
-            self.vector_store, "get_vectors_by_knowledge_id"
-        ), "Vector store must have method 'get_vectors_by_knowledge_id', this is an enterprise only feature"
+        if not hasattr(self.vector_store, "get_vectors_by_knowledge_id"):
+            raise ValueError(
+                "Vector store must have method 'get_vectors_by_knowledge_id', this is an enterprise only feature"
+            )
 
         for knowledge_id in top_knowledge_ids:
             _docs.append(
@@ -1164,36 +1153,31 @@ class QuivrQARAGLangGraph:
     def _extract_node_name(self, event: StreamEvent) -> str:
         if "metadata" in event and "langgraph_node" in event["metadata"]:
             name = event["metadata"]["langgraph_node"]
-            for node in self.retrieval_config.workflow_config.nodes:
-                if node.name == name:
-                    if node.description:
-                        return node.description
-                    else:
-                        return node.name
+            return self.retrieval_config.workflow_config.get_node_display_name(name)
         return ""
 
     async def ainvoke_structured_output(
         self, prompt: str, output_class: Type[BaseModel]
     ) -> Any:
         try:
-            structured_llm = self.llm_endpoint._llm.with_structured_output(
-                output_class, method="json_schema"
+            return await self.llm_endpoint.get_structured_llm(output_class).ainvoke(
+                prompt
             )
-            return await structured_llm.ainvoke(prompt)
         except openai.BadRequestError:
-            structured_llm = self.llm_endpoint._llm.with_structured_output(output_class)
+            structured_llm = self.llm_endpoint.get_structured_llm(
+                output_class, json_schema=False
+            )
             return await structured_llm.ainvoke(prompt)
 
     def invoke_structured_output(
         self, prompt: str, output_class: Type[BaseModel]
     ) -> Any:
         try:
-            structured_llm = self.llm_endpoint._llm.with_structured_output(
-                output_class, method="json_schema"
-            )
-            return structured_llm.invoke(prompt)
+            return self.llm_endpoint.get_structured_llm(output_class).invoke(prompt)
         except openai.BadRequestError:
-            structured_llm = self.llm_endpoint._llm.with_structured_output(output_class)
+            structured_llm = self.llm_endpoint.get_structured_llm(
+                output_class, json_schema=False
+            )
             return structured_llm.invoke(prompt)
 
     def _build_rag_prompt_inputs(
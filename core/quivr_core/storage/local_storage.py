@@ -1,7 +1,8 @@
+import asyncio
 import os
 import shutil
 from pathlib import Path
-from typing import Self, Set
+from typing import Dict, Self, Set
 from uuid import UUID
 
 from quivr_core.brain.serialization import LocalStorageConfig, TransparentStorageConfig
@@ -36,6 +37,8 @@ class LocalStorage(StorageBase):
     def __init__(self, dir_path: Path | None = None, copy_flag: bool = True):
         self.files: list[QuivrFile] = []
         self.hashes: Set[str] = set()
+        # Hashes of uploads whose copy is still in flight, with their count
+        self._pending_hashes: Dict[str, int] = {}
         self.copy_flag = copy_flag
 
         if dir_path is None:
@@ -75,17 +78,27 @@ class LocalStorage(StorageBase):
             self.dir_path, str(file.brain_id), f"{file.id}{file.file_extension}"
         )
 
-        if file.file_sha1 in self.hashes and not exists_ok:
+        sha1 = file.file_sha1
+        # In-flight uploads count as uploaded, so concurrent duplicates are rejected
+        if not exists_ok and (sha1 in self.hashes or sha1 in self._pending_hashes):
             raise FileExistsError(f"file {file.original_filename} already uploaded")
 
-        if self.copy_flag:
-            shutil.copy2(file.path, dst_path)
-        else:
-            os.symlink(file.path, dst_path)
-
-        file.path = Path(dst_path)
-        self.files.append(file)
-        self.hashes.add(file.file_sha1)
+        self._pending_hashes[sha1] = self._pending_hashes.get(sha1, 0) + 1
+        try:
+            # Copying can take a while for large files, keep it off the event loop
+            if self.copy_flag:
+                await asyncio.to_thread(shutil.copy2, file.path, dst_path)
+            else:
+                await asyncio.to_thread(os.symlink, file.path, dst_path)
+
+            file.path = Path(dst_path)
+            self.files.append(file)
+            self.hashes.add(sha1)
+        finally:
+            # Also runs when the upload fails or is cancelled mid-copy
+            self._pending_hashes[sha1] -= 1
+            if not self._pending_hashes[sha1]:
+                del self._pending_hashes[sha1]
 
     async def get_files(self) -> list[QuivrFile]:
         """
@@ -16,6 +16,9 @@ def test_recursive_character_splitter():
     assert [d.page_content for d in docs] == ["ab", "bc", "cd", "de", "ef", "fg", "gh"]
     assert [d.metadata for d in docs] == [doc.metadata] * len(docs)
 
+    with pytest.raises(ValueError):
+        recursive_character_splitter(doc, chunk_size=2, chunk_overlap=2)
+
 
 @pytest.mark.asyncio
 async def test_simple_processor(quivr_pdf, quivr_txt):
@@ -5,6 +5,7 @@ import pytest
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from quivr_core.brain import Brain
+from quivr_core.brain.serialization import BrainSerialized
 from quivr_core.rag.entities.chat import ChatHistory
 from quivr_core.llm import LLMEndpoint
 from quivr_core.storage.local_storage import TransparentStorage
@@ -149,3 +150,31 @@ def test_brain_info_empty(fake_llm: LLMEndpoint, embedder, mem_vector_store):
         },
         "llm_info": asdict(fake_llm.info()),
     }
+
+
+@pytest.mark.asyncio
+async def test_brain_save(fake_llm, tmp_path):
+    from langchain_community.vectorstores import FAISS
+    from langchain_openai import OpenAIEmbeddings
+
+    # Brain.save only serializes OpenAI embedders. Indexing precomputed vectors
+    # lets the vector store share that embedder without calling the API.
+    embedder = OpenAIEmbeddings(api_key="test")
+    vector_db = FAISS.from_embeddings([("some text", [0.1] * 8)], embedder)
+    brain = Brain(
+        name="test_brain",
+        id=uuid4(),
+        llm=fake_llm,
+        vector_db=vector_db,
+        embedder=embedder,
+        storage=TransparentStorage(),
+    )
+
+    brain_path = await brain.save(tmp_path)
+
+    bserialized = BrainSerialized.model_validate_json(
+        (tmp_path / f"brain_{brain.id}" / "config.json").read_text()
+    )
+    assert brain_path == str(tmp_path / f"brain_{brain.id}")
+    assert bserialized.name == "test_brain"
+    assert (tmp_path / f"brain_{brain.id}" / "vector_store" / "index.faiss").exists()
@@ -1,4 +1,14 @@
-from quivr_core.rag.entities.config import LLMEndpointConfig, RetrievalConfig
+import pytest
+
+from quivr_core.base_config import load_yaml
+from quivr_core.rag.entities.config import (
+    DefaultModelSuppliers,
+    LLMEndpointConfig,
+    LLMModelConfig,
+    NodeConfig,
+    RetrievalConfig,
+    WorkflowConfig,
+)
 
 
 def test_default_llm_config():
@@ -26,3 +36,68 @@ def test_default_retrievalconfig():
     print("\n\n", config.llm_config, "\n\n")
     print("\n\n", LLMEndpointConfig(), "\n\n")
     assert config.llm_config == LLMEndpointConfig()
+
+
+def test_llm_model_config_lookup_is_cached():
+    LLMModelConfig.get_llm_model_config.cache_clear()
+    LLMModelConfig.get_supplier_by_model_name.cache_clear()
+
+    first = LLMModelConfig.get_llm_model_config(
+        DefaultModelSuppliers.OPENAI, "gpt-4o-2024-08-06"
+    )
+    second = LLMModelConfig.get_llm_model_config(
+        DefaultModelSuppliers.OPENAI, "gpt-4o-2024-08-06"
+    )
+    assert first is not None
+    assert first is second
+    assert LLMModelConfig.get_llm_model_config.cache_info().hits == 1
+
+    for _ in range(2):
+        assert (
+            LLMModelConfig.get_supplier_by_model_name("claude-3-5-sonnet-latest")
+            == DefaultModelSuppliers.ANTHROPIC
+        )
+    assert LLMModelConfig.get_supplier_by_model_name.cache_info().hits == 1
+
+
+def test_load_yaml_returns_private_copies(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("max_files: 5\nprompt: hello\n")
+
+    data = load_yaml(config_path)
+    data["max_files"] = 42
+    assert load_yaml(config_path) == {"max_files": 5, "prompt": "hello"}
+
+    # A rewrite changing the file size is picked up even within one mtime tick
+    config_path.write_text("max_files: 7\n")
+    assert load_yaml(config_path) == {"max_files": 7}
+
+
+def test_workflow_config_node_display_name():
+    workflow_config = RetrievalConfig().workflow_config
+
+    assert workflow_config.get_node_display_name("generate_rag") == "generate_rag"
+    assert workflow_config.get_node_display_name("unknown") == ""
+
+
+def test_workflow_config_node_tools():
+    workflow_config = WorkflowConfig(
+        nodes=[
+            NodeConfig(name="START", edges=["retrieve"]),
+            NodeConfig(name="retrieve", edges=["END"]),
+        ]
+    )
+
+    assert workflow_config.get_node_tools("retrieve") == []
+    assert workflow_config.get_node_tools("unknown") == []
+
+
+@pytest.mark.asyncio
+async def test_retrievalconfig_afrom_yaml(tmp_path):
+    config_path = tmp_path / "retrieval_config.yaml"
+    config_path.write_text("max_files: 5\nprompt: hello\n")
+
+    config = await RetrievalConfig.afrom_yaml(config_path)
+
+    assert config.max_files == 5
+    assert config.prompt == "hello"
@@ -46,3 +46,22 @@ def test_llm_endpoint_constructor():
     )
 
     assert not llm_endpoint.supports_func_calling()
+
+
+@pytest.mark.base
+def test_llm_endpoint_structured_llm_is_memoized():
+    from langchain_openai import ChatOpenAI
+    from quivr_core.rag.quivr_rag_langgraph import SplittedInput, TasksCompletion
+
+    llm = LLMEndpoint(
+        llm=ChatOpenAI(model="gpt-4o", api_key="test"),
+        llm_config=LLMEndpointConfig(model="gpt-4o", llm_api_key="test"),
+    )
+
+    structured_llm = llm.get_structured_llm(SplittedInput)
+    assert llm.get_structured_llm(SplittedInput) is structured_llm
+
+    fallback_llm = llm.get_structured_llm(SplittedInput, json_schema=False)
+    assert fallback_llm is not structured_llm
+    assert llm.get_structured_llm(SplittedInput, json_schema=False) is fallback_llm
+    assert llm.get_structured_llm(TasksCompletion) is not structured_llm
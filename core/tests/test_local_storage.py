@@ -0,0 +1,129 @@
+import asyncio
+import shutil
+import threading
+from uuid import uuid4
+
+import pytest
+from quivr_core.files.file import FileExtension, QuivrFile
+from quivr_core.storage.local_storage import LocalStorage
+
+
+def _quivr_file(path, brain_id, file_sha1="123"):
+    return QuivrFile(
+        id=uuid4(),
+        brain_id=brain_id,
+        original_filename=path.name,
+        path=path,
+        file_extension=FileExtension.txt,
+        file_sha1=file_sha1,
+    )
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    return LocalStorage(dir_path=tmp_path / "storage")
+
+
+@pytest.mark.asyncio
+async def test_local_storage_upload_file(local_storage, temp_data_file):
+    brain_id = uuid4()
+    (local_storage.dir_path / str(brain_id)).mkdir()
+    file = _quivr_file(temp_data_file, brain_id)
+
+    await local_storage.upload_file(file)
+
+    assert local_storage.nb_files() == 1
+    assert file.path.parent == local_storage.dir_path / str(brain_id)
+    assert file.path.read_text() == "This is some test data."
+
+
+@pytest.mark.asyncio
+async def test_local_storage_concurrent_duplicate_upload(local_storage, temp_data_file):
+    brain_id = uuid4()
+    (local_storage.dir_path / str(brain_id)).mkdir()
+
+    results = await asyncio.gather(
+        local_storage.upload_file(_quivr_file(temp_data_file, brain_id)),
+        local_storage.upload_file(_quivr_file(temp_data_file, brain_id)),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], FileExistsError)
+    assert local_storage.nb_files() == 1
+
+
+@pytest.mark.asyncio
+async def test_local_storage_failed_upload_releases_hash(local_storage, temp_data_file):
+    brain_id = uuid4()
+    file = _quivr_file(temp_data_file, brain_id)
+
+    # The brain directory does not exist, so the copy fails
+    with pytest.raises(FileNotFoundError):
+        await local_storage.upload_file(file)
+    assert local_storage.nb_files() == 0
+
+    (local_storage.dir_path / str(brain_id)).mkdir()
+    await local_storage.upload_file(file)
+    assert local_storage.nb_files() == 1
+
+
+@pytest.mark.asyncio
+async def test_local_storage_cancelled_upload_releases_hash(
+    local_storage, temp_data_file, monkeypatch
+):
+    brain_id = uuid4()
+    (local_storage.dir_path / str(brain_id)).mkdir()
+    copy_started = threading.Event()
+    release_copy = threading.Event()
+    real_copy2 = shutil.copy2
+
+    def slow_copy2(src, dst):
+        copy_started.set()
+        release_copy.wait(timeout=5)
+        return real_copy2(src, dst)
+
+    monkeypatch.setattr(shutil, "copy2", slow_copy2)
+    upload = asyncio.create_task(
+        local_storage.upload_file(_quivr_file(temp_data_file, brain_id))
+    )
+    await asyncio.to_thread(copy_started.wait, 5)
+    upload.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await upload
+    release_copy.set()
+
+    assert local_storage.nb_files() == 0
+    monkeypatch.setattr(shutil, "copy2", real_copy2)
+    await local_storage.upload_file(_quivr_file(temp_data_file, brain_id))
+    assert local_storage.nb_files() == 1
+
+
+@pytest.mark.asyncio
+async def test_local_storage_failed_concurrent_upload_keeps_other_hash(
+    local_storage, temp_data_file, monkeypatch
+):
+    brain_id = uuid4()
+    (local_storage.dir_path / str(brain_id)).mkdir()
+    failing_file = _quivr_file(temp_data_file, brain_id)
+    real_copy2 = shutil.copy2
+
+    def flaky_copy2(src, dst):
+        if str(failing_file.id) in str(dst):
+            raise OSError("disk full")
+        return real_copy2(src, dst)
+
+    monkeypatch.setattr(shutil, "copy2", flaky_copy2)
+    results = await asyncio.gather(
+        local_storage.upload_file(failing_file, exists_ok=True),
+        local_storage.upload_file(
+            _quivr_file(temp_data_file, brain_id), exists_ok=True
+        ),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], OSError)
+    assert results[1] is None
+    assert local_storage.nb_files() == 1
+    with pytest.raises(FileExistsError):
+        await local_storage.upload_file(_quivr_file(temp_data_file, brain_id))